@@ -13,7 +13,12 @@ Behavior:
 """
 
 # ---------- 1) Imports & Global Configuration ----------
-import os, csv, time, threading, logging
+import os, csv, time, queue, threading, logging, logging.handlers, atexit
+from collections import namedtuple
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, date, timedelta, time as dtime
 try:
     # Python 3.9+; on Windows also `pip install tzdata`
@@ -23,6 +28,10 @@ except ModuleNotFoundError:
 
 import tkinter as tk
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+from dateutil.easter import easter  # python-dateutil ships with matplotlib
 
 # Matplotlib (no toolbar); we embed it into Tkinter
 import matplotlib
@@ -39,6 +48,7 @@ if not API_KEY:
 # --- Tickers & refresh cadence ---
 TICKERS = ["SPY", "DIA", "QQQ"]
 REFRESH_SECONDS = 300  # 5 minutes
+CLOSED_RECHECK_SECONDS = 15 * 60  # while closed, re-check at least this often (sleep/NTP safe)
 
 # --- Time zone & market hours (Central Time) ---
 TZ = ZoneInfo("America/Chicago")
@@ -65,23 +75,34 @@ DOWN = "#7f1d1d"    # dark red
 # ---------- 2) Logging ----------
 os.makedirs(DATA_ROOT, exist_ok=True)
 LOG_PATH = os.path.expanduser("~/market/market.log")
-logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s"
-)
+# Buffer records in memory and write them to the SD card in batches;
+# an ERROR (or shutdown) flushes immediately so nothing important is lost.
+_log_file = logging.FileHandler(LOG_PATH)
+_log_file.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_buffer = logging.handlers.MemoryHandler(64, flushLevel=logging.ERROR, target=_log_file)
+logging.getLogger().addHandler(_log_buffer)
+logging.getLogger().setLevel(logging.INFO)
+atexit.register(_log_buffer.close)  # close() flushes the buffer to the file first
 
 # ---------- 3) Runtime State ----------
-# In-memory arrays for today's session; cleared at next market open (8:30 CT)
-time_points: list[datetime] = []
-prices: dict[str, list[float | None]] = {t: [] for t in TICKERS}
+# In-memory arrays for today's session; cleared at next market open (8:30 CT).
+# Preallocated per-ticker columns (NaN = missing quote) sharing one timestamp column;
+# only the first `n_points` entries are live.
+_SESSION_MINUTES = (MARKET_CLOSE_CT.hour * 60 + MARKET_CLOSE_CT.minute) - (MARKET_OPEN_CT.hour * 60 + MARKET_OPEN_CT.minute)
+MAX_POINTS = (_SESSION_MINUTES * 60) // REFRESH_SECONDS + 4  # ~80 at 5-min cadence
+ts_num = np.empty(MAX_POINTS, dtype=np.float64)  # Matplotlib date numbers (converted once, on append)
+prices_arr: dict[str, np.ndarray] = {t: np.full(MAX_POINTS, np.nan, dtype=np.float32) for t in TICKERS}
+n_points = 0
 prev_close: dict[str, float | None] = {t: None for t in TICKERS}
-current_day = date.today()
+# One refresh cycle's prices, in TICKERS order (None = no quote). Read positionally via
+# zip(TICKERS, snap); rename=True lets symbols like "BRK.B" or "^GSPC" be used as tickers.
+Snap = namedtuple("Snap", TICKERS, rename=True)
+current_day = datetime.now(TZ).date()  # CT calendar day, not the host's local day
 
 # ---------- 4) Storage (CSV) ----------
 def today_dir(d: date | None = None) -> str:
     """Directory for today's data, e.g. ~/market/data/2025-08-26/"""
-    d = d or date.today()
+    d = d or datetime.now(TZ).date()
     p = os.path.join(DATA_ROOT, d.isoformat())
     os.makedirs(p, exist_ok=True)
     return p
@@ -90,43 +111,76 @@ def today_csv_path(d: date | None = None) -> str:
     """Path to today's CSV (ts, SPY, DIA, QQQ)."""
     return os.path.join(today_dir(d), "prices.csv")
 
+def push_point(ts: datetime, snap: Snap) -> None:
+    """Append one sample to the session arrays; once full, drop the oldest (deque-style)."""
+    global n_points
+    if n_points == MAX_POINTS:
+        # Only reachable after restarts re-sample an interval; shift left by one slot
+        ts_num[:-1] = ts_num[1:]
+        for col in prices_arr.values():
+            col[:-1] = col[1:]
+        n_points -= 1
+    ts_num[n_points] = mdates.date2num(ts)
+    for t, v in zip(TICKERS, snap):
+        prices_arr[t][n_points] = v if v is not None else np.nan
+    n_points += 1
+
 def load_today() -> None:
     """Load today's CSV (if present) so we resume mid-session after a restart."""
+    global n_points
     p = today_csv_path()
     if not os.path.exists(p):
         return
     try:
         with open(p, "r", newline="") as f:
-            r = csv.DictReader(f)
-            for row in r:
-                ts = datetime.fromisoformat(row["ts"]).astimezone(TZ)
-                time_points.append(ts)
-                for t in TICKERS:
-                    v = row.get(t)
-                    prices[t].append(float(v) if v not in (None, "", "nan") else None)
-        logging.info("Loaded %d prior points for today", len(time_points))
+            header = next(csv.reader(f), None)
+            if header is None:
+                return
+            # Keep only complete rows: a torn last write (power loss) has too few fields and
+            # the row appended onto it too many, so one bad line can't void the whole resume
+            lines = [ln for ln in (raw.rstrip("\r\n") for raw in f) if ln]
+        good = [ln for ln in lines if ln.count(",") == len(header) - 1]
+        if len(good) < len(lines):
+            logging.warning("Skipped %d malformed row(s) in %s", len(lines) - len(good), p)
+        if not good:  # header-only file
+            return
+        # One C-level pass over the body; columns are converted in bulk below
+        rows = np.loadtxt(good, delimiter=",", dtype=str, ndmin=2)
+        n = len(rows)
+        if n > MAX_POINTS:  # keep the most recent samples
+            rows, n = rows[-MAX_POINTS:], MAX_POINTS
+        # Timestamps were written by isoformat() as local CT with their offset. A trading day
+        # never crosses a DST switch, so take the offset from the first row and parse only the
+        # "YYYY-MM-DDTHH:MM:SS" heads in bulk (no per-row datetime / tz conversion).
+        ts = rows[:, header.index("ts")]
+        off = datetime.fromisoformat(ts[0]).utcoffset()
+        utc = ts.astype("U19").astype("datetime64[s]") - np.timedelta64(int(off.total_seconds()), "s")
+        ts_num[:n] = mdates.date2num(utc)
+        for t in TICKERS:
+            if t in header:
+                col = rows[:, header.index(t)]
+                prices_arr[t][:n] = np.where(col == "", "nan", col).astype(np.float32)
+        n_points = n
+        logging.info("Loaded %d prior points for today", n_points)
     except Exception as e:
         logging.error("Failed loading today data: %s", e)
 
-def append_today(ts_local: datetime, snapshot: dict[str, float | None]) -> None:
-    """Append one row (ISO ts + prices) to today's CSV."""
-    p = today_csv_path()
-    is_new = not os.path.exists(p)
-    with open(p, "a", newline="") as f:
-        w = csv.writer(f)
-        if is_new:
-            w.writerow(["ts"] + TICKERS)
-        w.writerow([ts_local.isoformat()] + [
-            f"{snapshot.get(t,'')}" if snapshot.get(t) is not None else "" for t in TICKERS
-        ])
+def _ends_with_newline(path: str) -> bool:
+    """True if the (non-empty) file at `path` ends with a line terminator."""
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
 
 # ---------- 5) Market Days & Holidays ----------
 # Try to use the `holidays` package; else fallback to minimal built-in list (NYSE 2024–2027).
-_US_HOLIDAYS = None
 try:
     import holidays  # pip install holidays
     _US_HOLIDAYS = holidays.US()  # observed US federal holidays; we add Good Friday below
+except ImportError:
+    _US_HOLIDAYS = None
 except Exception:
+    # Broken/incompatible install: keep running on the built-in list, but make it visible
+    logging.exception("holidays package failed to load; using built-in holiday list")
     _US_HOLIDAYS = None
 
 # Minimal built-in for 2024–2027 (standard NYSE closures incl. Good Friday)
@@ -150,31 +204,38 @@ _BUILTIN_HOLIDAYS = {
     DateOnly(2027,12,24),
 }
 
+@lru_cache(maxsize=None)
+def _good_friday(year: int) -> date:
+    """Good Friday (two days before Easter Sunday); NYSE closes but it isn't a federal holiday."""
+    return easter(year) - timedelta(days=2)
+
 def is_us_holiday(d: date) -> bool:
     """True if `d` is a US market holiday (observed). Adds Good Friday if using holidays lib."""
     if _US_HOLIDAYS is not None:
-        if d in _US_HOLIDAYS:
-            return True
-        # Add Good Friday (two days before Easter Sunday)
-        try:
-            import holidays.calendars as cal  # internal Easter algorithm
-            easter = cal._ChristianHolidays()._easter(d.year)
-            good_friday = easter - timedelta(days=2)
-            if d == good_friday.date():
-                return True
-        except Exception:
-            pass
-        return False
+        return d in _US_HOLIDAYS or d == _good_friday(d.year)
     # Fallback built-in list
     return d in _BUILTIN_HOLIDAYS
 
+# Precomputed calendar for [today-2y, today+5y] (a restart rebuilds it). The holiday
+# sources above are consulted only here, once at startup; per-refresh checks are a weekday
+# test plus a small set lookup, and wake-up scheduling is a bisect over market-day ordinals.
+_FIRST_ORD = (date.today() - timedelta(days=2 * 365)).toordinal()
+_LAST_ORD = (date.today() + timedelta(days=5 * 365)).toordinal()
+
+def _build_holiday_set() -> frozenset[date]:
+    """Every weekday market holiday (incl. Good Friday) in the precomputed window."""
+    days = (date.fromordinal(o) for o in range(_FIRST_ORD, _LAST_ORD + 1))
+    return frozenset(d for d in days if d.weekday() < 5 and is_us_holiday(d))
+
+_HOLIDAY_SET: frozenset[date] = _build_holiday_set()
+
 def is_market_day(d: date) -> bool:
     """True if Mon–Fri AND not a holiday."""
-    if d.weekday() >= 5:  # 5=Sat, 6=Sun
-        return False
-    if is_us_holiday(d):
-        return False
-    return True
+    return d.weekday() < 5 and d not in _HOLIDAY_SET
+
+_MARKET_DAY_SORTED = array("i", (
+    o for o in range(_FIRST_ORD, _LAST_ORD + 1) if is_market_day(date.fromordinal(o))
+))
 
 def next_market_open_after(now_local: datetime) -> datetime:
     """
@@ -182,16 +243,29 @@ def next_market_open_after(now_local: datetime) -> datetime:
     Used to sleep until the next time we should wake up and reset/fetch.
     """
     d = now_local.date()
-    while True:
-        if is_market_day(d):
-            open_dt = datetime.combine(d, MARKET_OPEN_CT, tzinfo=TZ)
-            if open_dt > now_local:
-                return open_dt
+    if now_local.time() >= MARKET_OPEN_CT:
+        d += timedelta(days=1)  # today's open has already passed
+    i = bisect_left(_MARKET_DAY_SORTED, d.toordinal())
+    if i < len(_MARKET_DAY_SORTED):
+        return datetime.combine(date.fromordinal(_MARKET_DAY_SORTED[i]), MARKET_OPEN_CT, tzinfo=TZ)
+    while not is_market_day(d):
         d += timedelta(days=1)
+    return datetime.combine(d, MARKET_OPEN_CT, tzinfo=TZ)
 
 # ---------- 6) Finnhub API ----------
 SESSION = requests.Session()
+# Keep-alive pool sized for every ticker in flight at once, with a short retry on
+# transient 429/5xx. raise_on_status=False hands the final 429 back to get_quote's branch.
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=len(TICKERS) * 2,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+))
+SESSION.headers["Connection"] = "keep-alive"
 BASE = "https://finnhub.io/api/v1"
+# One worker per ticker so all quotes go out together over the shared keep-alive pool
+_QUOTE_POOL = ThreadPoolExecutor(max_workers=len(TICKERS), thread_name_prefix="quote")
 
 def get_quote(symbol: str) -> tuple[float | None, float | None]:
     """Fetch (current price, previous close) or (None, None) on error/rate-limit."""
@@ -207,6 +281,10 @@ def get_quote(symbol: str) -> tuple[float | None, float | None]:
         logging.warning("Quote error %s: %s", symbol, e)
         return None, None
 
+def get_quotes(symbols: list[str]) -> list[tuple[float | None, float | None]]:
+    """Fetch all quotes concurrently; results are in the same order as `symbols`."""
+    return list(_QUOTE_POOL.map(get_quote, symbols))
+
 # ---------- 7) Market-Hours Helpers ----------
 def is_market_open(now_local: datetime) -> bool:
     """True only when TODAY is a market day and the local time is within 8:30–15:00 CT."""
@@ -289,16 +367,17 @@ class App(tk.Tk):
 
             ax.xaxis.set_major_locator(locator)
             ax.xaxis.set_major_formatter(formatter)
+            ax.set_autoscale_on(False)  # limits are managed explicitly (_set_window / _redraw_chart)
 
-            # One line per ticker; also track dashed prev-close line handles
-            line, = ax.plot([], [], color=COLORS[t], linewidth=2.0, label=t)
-            ax._pc_lines = []  # artists for dashed lines to clear/redraw
-            self.lines[t] = (ax, line)
+            # One line per ticker plus its dashed prev-close line (created once, updated in place).
+            # Both are `animated` so full draws leave them out of the cached blit backgrounds.
+            line, = ax.plot([], [], color=COLORS[t], linewidth=2.0, label=t, animated=True)
+            ref, = ax.plot([], [], linestyle="--", linewidth=1.0, color="white", alpha=0.75,
+                           visible=False, animated=True)
+            self.lines[t] = (ax, line, ref)
 
         # Clamp x-axis to today's 8:30–15:00 window from the start
-        self.open_dt, self.close_dt = today_window(datetime.now(TZ))
-        for ax in self.axes:
-            ax.set_xlim(self.open_dt, self.close_dt)
+        self._set_window(datetime.now(TZ))
 
         # Embed figure into Tk
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
@@ -306,73 +385,143 @@ class App(tk.Tk):
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True,
                                          padx=14, pady=(6, 12))
 
-        # Kick off the loop
+        # Blitting: every full draw (first show, resize, y-limit change) re-captures the
+        # static axes backgrounds; regular updates only repaint the line artists.
+        self._bg = None
+        self._last_sig = None  # what the last _redraw_chart rendered; see there
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # Long-lived CSV handle for today's file (opened lazily by _csv_for)
+        self._csv_fp = None
+        self._csv_writer = None
+        self._csv_day: date | None = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        atexit.register(self._close_csv)
+
+        # One long-lived worker runs the refresh cycles; Tk's after() only posts jobs to it.
+        # `_stop` is set on window close so an in-flight cycle stops writing and scheduling.
+        self._work: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+        self._worker_thread = threading.Thread(target=self._worker, name="refresh", daemon=True)
+        self._worker_thread.start()
+
+        # Kick off the loop; `_schedule` records when each wake-up is due (see _refresh_once)
+        self._last_wall: float | None = None
+        self._expected_s = 0.0
         self.after(250, self.refresh_loop)
 
+    def _set_window(self, now_local: datetime) -> None:
+        """Set today's 8:30–15:00 x-window on all axes (and the prev-close line's x-span)."""
+        self.open_dt, self.close_dt = today_window(now_local)
+        self._open_num, self._close_num = mdates.date2num([self.open_dt, self.close_dt])
+        for ax in self.axes:
+            ax.set_xlim(self._open_num, self._close_num)
+        self._ylim: dict[str, tuple[float, float]] = {}  # per-ticker y envelope; see _redraw_chart
+        self._needs_full_draw = True
+
     # ---------- 9) Refresh Loop ----------
     def refresh_loop(self):
-        """Spawn a single update cycle in a thread; schedule the next cycle from there."""
-        threading.Thread(target=self._refresh_once, daemon=True).start()
+        """Queue a single update cycle for the worker; the cycle schedules the next one."""
+        self._work.put_nowait(())
+
+    def _schedule(self, ms: int) -> None:
+        """Run the next cycle in `ms` milliseconds, noting when (wall clock) it should fire."""
+        if self._stop.is_set():
+            return
+        self._last_wall = time.time()
+        self._expected_s = ms / 1000
+        self.after(ms, self.refresh_loop)
+
+    def _worker(self):
+        """Worker thread: run one `_refresh_once` per queued job; `None` means shut down."""
+        while True:
+            if self._work.get() is None:
+                self._close_csv()  # the worker owns the CSV handle, so it closes it
+                return
+            try:
+                self._refresh_once()
+            except Exception:
+                if self._stop.is_set():
+                    continue  # Tk already torn down mid-cycle; the sentinel is next
+                logging.exception("Refresh cycle failed; retrying next interval")
+                self._schedule(REFRESH_SECONDS * 1000)
+
+    def _set_status(self, text: str) -> None:
+        """Update the status line (Tk thread only)."""
+        self.status.config(text=text)
 
     def _refresh_once(self):
         """One cycle: decide whether to fetch or sleep; update charts/UI accordingly."""
-        global current_day
+        global current_day, n_points
+        if self._stop.is_set():
+            return
+        # Wall-clock time since scheduling far from the planned delay? That's a suspend/resume,
+        # an NTP/manual clock step or a stalled loop (CLOCK_MONOTONIC would miss the first two
+        # on Linux). The session reset and market-hours checks below run from the fresh clock
+        # read; also drop the cached blit backgrounds/signature so the chart re-renders fully.
+        if self._last_wall is not None:
+            drift = (time.time() - self._last_wall) - self._expected_s
+            if abs(drift) > max(0.5 * self._expected_s, 60):
+                logging.warning("Wall clock drifted %+.0fs from the scheduled %.0fs wake-up; "
+                                "re-evaluating state", drift, self._expected_s)
+                self.after(0, self._invalidate_chart)
+
+        # Read the clock once; everything below works from this snapshot
         now_local = datetime.now(TZ)
+        today, now_t = now_local.date(), now_local.time()
+        market_day = is_market_day(today)
 
         # New calendar day? If it's a market day and we're at/after open, reset.
-        if date.today() != current_day and is_market_day(now_local.date()) and now_local.time() >= MARKET_OPEN_CT:
-            current_day = date.today()
-            time_points.clear()
+        if today != current_day and market_day and now_t >= MARKET_OPEN_CT:
+            current_day = today
+            n_points = 0
             for t in TICKERS:
-                prices[t].clear()
-            # Recompute today's x-window and apply
-            self.open_dt, self.close_dt = today_window(now_local)
-            for ax in self.axes:
-                ax.set_xlim(self.open_dt, self.close_dt)
+                prices_arr[t].fill(np.nan)
+            # Recompute today's x-window and apply (on the Tk thread, ahead of the redraw)
+            self.after(0, self._set_window, now_local)
             logging.info("New trading session started at 8:30 AM CT — cleared previous day.")
 
         # If NOT a market day (weekend/holiday) → hold last screen; wake at next market open
-        if not is_market_day(now_local.date()):
+        if not market_day:
             nxt = next_market_open_after(now_local)
-            self.status.config(text="Market Closed (Holiday/Weekend) — holding last session")
-            self.after(ms_until(nxt, now_local), self.refresh_loop)
+            self.after(0, self._set_status, "Market Closed (Holiday/Weekend) — holding last session")
+            self._schedule(min(ms_until(nxt, now_local), CLOSED_RECHECK_SECONDS * 1000))
             return
 
         # If outside 8:30–15:00 CT today → hold last screen; wake at next market open
-        if not (MARKET_OPEN_CT <= now_local.time() <= MARKET_CLOSE_CT):
+        if not (MARKET_OPEN_CT <= now_t <= MARKET_CLOSE_CT):
             nxt = next_market_open_after(now_local)
-            self.status.config(text="Market Closed — charts reset next market day 8:30 AM CT")
-            self.after(ms_until(nxt, now_local), self.refresh_loop)
+            self.after(0, self._set_status, "Market Closed — charts reset next market day 8:30 AM CT")
+            self._schedule(min(ms_until(nxt, now_local), CLOSED_RECHECK_SECONDS * 1000))
             return
         else:
-            self.status.config(text="")
+            self.after(0, self._set_status, "")
 
         # ---- Market is OPEN: fetch and render ----
-        snapshot: dict[str, float | None] = {}
-        for t in TICKERS:
-            cur, pc = get_quote(t)
+        quotes = get_quotes(TICKERS)
+        for t, (_, pc) in zip(TICKERS, quotes):
             if pc is not None:
                 prev_close[t] = pc  # yesterday's 3:00 PM CT close until today's is set
-            snapshot[t] = float(cur) if cur is not None else None
-            time.sleep(0.20)  # tiny spacing to be nice to API
+        snap = Snap(*(float(cur) if cur is not None else None for cur, _ in quotes))
+
+        # Window closed while the fetch was in flight? Don't reopen the CSV or touch Tk.
+        if self._stop.is_set():
+            return
 
         # Store in-memory + append to today's CSV
-        time_points.append(now_local)
-        for t in TICKERS:
-            prices[t].append(snapshot.get(t))
-        append_today(now_local, snapshot)
+        push_point(now_local, snap)
+        self.append_today(now_local, snap)
 
-        # Update header UI & charts, then schedule next refresh
-        self._apply_header(snapshot)
-        self._redraw_chart()
-        self.after(REFRESH_SECONDS * 1000, self.refresh_loop)
+        # Update header UI & charts on the Tk thread, then schedule next refresh
+        self.after(0, self._apply_header, snap)
+        self.after(0, self._redraw_chart)
+        self._schedule(REFRESH_SECONDS * 1000)
 
     # ---------- 10) Header Update ----------
-    def _apply_header(self, snapshot: dict[str, float | None]) -> None:
+    def _apply_header(self, snap: Snap) -> None:
         """Update price + change text/colors for the header boxes."""
-        for t in TICKERS:
+        for t, cur in zip(TICKERS, snap):
             price_var, change_var, change_lbl = self.boxes[t]
-            cur = snapshot.get(t)
             pc = prev_close.get(t)
 
             # Price text
@@ -391,48 +540,120 @@ class App(tk.Tk):
 
     # ---------- 11) Redraw Charts ----------
     def _redraw_chart(self) -> None:
-        """Set line data, enforce x-limits, draw dashed prev-close line, pad y-limits, redraw."""
+        """Set line data, update dashed prev-close line, pad y-limits, then blit (or full redraw)."""
+        # Nothing new since the last render (same points, prices and prev-closes)? Skip it all.
+        # NaN never equals itself, so missing quotes are keyed as None.
+        n = n_points
+        last = [prices_arr[t][n - 1] for t in TICKERS] if n else []
+        sig = (n, ts_num[n - 1] if n else None, *(None if np.isnan(v) else float(v) for v in last),
+               *prev_close.values(), self._needs_full_draw)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        x = ts_num[:n]
         for t in TICKERS:
-            ax, line = self.lines[t]
+            ax, line, ref = self.lines[t]
 
-            # Data for this ticker
-            y = [v for v in prices[t] if v is not None]
-            x = time_points[:len(y)]
+            # Data for this ticker (NaN gaps are skipped by Matplotlib)
+            y = prices_arr[t][:n]
 
-            # Update main line + keep x clamped to 8:30–15:00
+            # Update main line (x stays clamped to 8:30–15:00 by _set_window)
             line.set_data(x, y)
-            ax.set_xlim(self.open_dt, self.close_dt)
 
-            # Remove any prior dashed lines (avoid stacking)
-            for artist in list(ax._pc_lines):
-                try:
-                    artist.remove()
-                except:
-                    pass
-            ax._pc_lines.clear()
-
-            # Draw dashed previous-close reference line (yesterday's 3:00 PM CT close)
+            # Dashed previous-close reference line (yesterday's 3:00 PM CT close)
             pc = prev_close.get(t)
             if pc is not None:
-                ref = ax.axhline(pc, linestyle="--", linewidth=1.0, color="white", alpha=0.75)
-                ax._pc_lines.append(ref)
-
-            # Y-limits: include today's data and the prev-close line, add a bit of padding
-            if y:
-                ymin, ymax = min(y), max(y)
+                ref.set_data((self._open_num, self._close_num), (pc, pc))
+            ref.set_visible(pc is not None)
+
+            # Y-limits: must include today's data and the prev-close line. Only rescale when
+            # one of them leaves the current envelope; the new envelope gets extra headroom so
+            # the next few ticks usually fit and the blit background stays valid.
+            span = None
+            if not np.isnan(y).all():
+                ymin, ymax = float(np.nanmin(y)), float(np.nanmax(y))
                 if pc is not None:
                     ymin, ymax = min(ymin, pc), max(ymax, pc)
+                span = (ymin, ymax)
+            elif pc is not None:
+                span = (pc, pc)
+            env = self._ylim.get(t)
+            if span is not None and (env is None or span[0] < env[0] or span[1] > env[1]):
+                ymin, ymax = span
                 if ymin == ymax:
                     pad = max(0.5, 0.005 * (ymin if ymin else 1))
                 else:
-                    pad = 0.02 * (ymax - ymin)
-                ax.set_ylim(ymin - pad, ymax + pad)
-            elif pc is not None:
-                ax.set_ylim(pc * 0.995, pc * 1.005)
+                    pad = 0.10 * (ymax - ymin)
+                self._ylim[t] = (ymin - pad, ymax + pad)
+                ax.set_ylim(*self._ylim[t])
+                self._needs_full_draw = True  # ticks changed → background is stale
 
+        if self._needs_full_draw or self._bg is None:
+            self._full_redraw()
+        else:
+            self._blit()
+
+    def _invalidate_chart(self) -> None:
+        """Forget the last render so the next redraw is a full one; re-render what's held now."""
+        self._last_sig = None
+        self._full_redraw()
+
+    def _full_redraw(self) -> None:
+        """Re-render the whole figure; `_on_draw` then re-captures the blit backgrounds."""
+        self._needs_full_draw = False
         self.canvas.draw_idle()
 
-# ---------- 12) Entrypoint ----------
+    def _on_draw(self, event) -> None:
+        """After any full draw: cache each axes background, then paint the animated lines."""
+        self._bg = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axes]
+        for ax, line, ref in self.lines.values():
+            ax.draw_artist(line)
+            ax.draw_artist(ref)
+
+    def _blit(self) -> None:
+        """Fast path: restore cached backgrounds and repaint only the line artists."""
+        for bg, (ax, line, ref) in zip(self._bg, self.lines.values()):
+            self.canvas.restore_region(bg)
+            ax.draw_artist(line)
+            ax.draw_artist(ref)
+            self.canvas.blit(ax.bbox)
+
+    # ---------- 12) Storage (buffered CSV writer) ----------
+    def _csv_for(self, day: date):
+        """Writer for `day`'s CSV; opened once per session and reopened on day rollover."""
+        if self._csv_day != day:
+            self._close_csv()
+            self._csv_fp = open(today_csv_path(day), "a", buffering=8192, newline="")
+            self._csv_writer = csv.writer(self._csv_fp)
+            self._csv_day = day
+            if self._csv_fp.tell() == 0:  # new/empty file → header first
+                self._csv_writer.writerow(["ts"] + TICKERS)
+            elif not _ends_with_newline(self._csv_fp.name):
+                self._csv_fp.write("\r\n")  # torn last write (power loss): don't glue onto it
+        return self._csv_writer
+
+    def append_today(self, ts_local: datetime, snap: Snap) -> None:
+        """Append one row (ISO ts + prices) to today's CSV."""
+        self._csv_for(ts_local.date()).writerow(
+            (ts_local.isoformat(), *("" if v is None else v for v in snap))
+        )
+        # One write per 5-min row (no open/stat/close); keeps the file resumable after a crash
+        self._csv_fp.flush()
+
+    def _close_csv(self) -> None:
+        """Flush and close the CSV handle (safe to call more than once)."""
+        if self._csv_fp is not None:
+            self._csv_fp.close()
+        self._csv_fp = self._csv_writer = self._csv_day = None
+
+    def _on_close(self) -> None:
+        """Window closed: stop the worker (it closes the CSV on the sentinel), then tear down Tk."""
+        self._stop.set()
+        self._work.put(None)
+        self.destroy()
+
+# ---------- 13) Entrypoint ----------
 def main():
     """Load today's CSV (if any), create the app, run fullscreen (Esc exits)."""
     load_today()